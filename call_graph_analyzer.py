@@ -1,11 +1,14 @@
+import io
+from array import array
 from typing import Dict, List, Set, Optional, Tuple
+from collections import defaultdict
 from dataclasses import dataclass
 from java_parser import FunctionInfo, JavaParser
 import logging
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class CallChain:
     """Function call chain information"""
     function: FunctionInfo
@@ -18,185 +21,296 @@ class CallGraphAnalyzer:
     def __init__(self, functions: Dict[str, FunctionInfo]):
         self.functions = functions
         self.call_graph: Dict[str, List[str]] = {}
+        # Cache of fully-built subtrees keyed by (function_id, remaining_depth)
+        # so shared callees are expanded once and referenced multiple times
+        self._chain_cache: Dict[Tuple[int, int], CallChain] = {}
+        # Reachable callee ids per function (fixed once the graph is built)
+        # and subtrees that were expanded without any depth/cycle clipping;
+        # both survive across get_call_chain calls. Full subtrees are keyed
+        # by (function_id, depth) so the depth values stored inside the
+        # cached nodes stay correct wherever they are reattached
+        self._reachable: Dict[int, frozenset] = {}
+        self._full_chain_cache: Dict[Tuple[int, int], CallChain] = {}
+        # Inverted indexes for find_function_by_name lookups
+        self._by_method: Dict[str, List[str]] = defaultdict(list)
+        self._by_endpoint: Dict[str, List[str]] = defaultdict(list)
+        self._by_endpoint_token: Dict[str, List[str]] = defaultdict(list)
+        # Integer-id view of the graph: traversals compare ints instead of
+        # hashing function-key strings on every step
+        self._id_of: Dict[str, int] = {}
+        self._info_of: List[FunctionInfo] = []
+        self._adj: List[array] = []
         self._build_call_graph()
-    
+
     def _build_call_graph(self) -> None:
-        """Build the call graph from function information"""
+        """Build the call graph and lookup indexes from function information"""
         for func_key, func_info in self.functions.items():
             self.call_graph[func_key] = func_info.called_functions.copy()
-    
-    def find_function_by_name(self, function_name: str) -> List[str]:
-        """Find function keys that match the given function name"""
+
+            # Assign each function a dense integer id
+            self._id_of[func_key] = len(self._info_of)
+            self._info_of.append(func_info)
+
+            # Index by method name (last segment of the function key)
+            method_name = func_key.rsplit('.', 1)[-1]
+            self._by_method[method_name].append(func_key)
+
+            # Index REST endpoints by full path and by path token
+            if func_info.is_rest_endpoint and func_info.endpoint_path:
+                self._by_endpoint[func_info.endpoint_path].append(func_key)
+                for token in func_info.endpoint_path.split('/'):
+                    if token:
+                        self._by_endpoint_token[token].append(func_key)
+
+        # Adjacency as compact unsigned-int rows; unresolved callees
+        # (not parsed into self.functions) are dropped here once instead
+        # of being re-checked on every traversal
+        for func_info in self._info_of:
+            self._adj.append(array('I', (
+                self._id_of[called]
+                for called in func_info.called_functions
+                if called in self._id_of
+            )))
+
+    def find_function_by_name(self, function_name: str, limit: Optional[int] = None) -> List[str]:
+        """Find function keys that match the given function name
+
+        An optional limit short-circuits the lookup once enough matches are
+        found, letting callers that only need the first hit skip the
+        endpoint lookups entirely.
+        """
         matching_functions = []
-        
+
         # Exact match first
         if function_name in self.functions:
             matching_functions.append(function_name)
-        
-        # Check for class.method format
-        for func_key in self.functions.keys():
-            if func_key.endswith(f".{function_name}"):
-                matching_functions.append(func_key)
-        
-        # Check for REST endpoint path match
+            if limit is not None and len(matching_functions) >= limit:
+                return matching_functions
+
+        # Method name lookup via the prebuilt index
+        matching_functions.extend(self._by_method.get(function_name, []))
+        if limit is not None and len(matching_functions) >= limit:
+            return list(dict.fromkeys(matching_functions))[:limit]
+
+        # REST endpoint lookup: indexed exact-path and path-token hits rank
+        # first so they keep their match priority
+        matching_functions.extend(self._by_endpoint.get(function_name, []))
+        matching_functions.extend(self._by_endpoint_token.get(function_name.strip('/'), []))
+        if limit is not None and len(matching_functions) >= limit:
+            return list(dict.fromkeys(matching_functions))[:limit]
+
+        # The substring scan always runs (an exact-path hit does not cover
+        # it): '/api/users' must still match '/api/users/{id}' and
+        # '/api/users/delete' like the original single-pass lookup did
         for func_key, func_info in self.functions.items():
             if func_info.is_rest_endpoint and function_name in func_info.endpoint_path:
                 matching_functions.append(func_key)
-        
-        return matching_functions
+
+        # Dedupe while preserving match priority order
+        deduped = list(dict.fromkeys(matching_functions))
+        return deduped[:limit] if limit is not None else deduped
     
     def get_call_chain(self, function_key: str, max_depth: int = 10) -> Optional[CallChain]:
         """Get the complete call chain starting from the given function"""
         if function_key not in self.functions:
             return None
-        
-        visited = set()
-        return self._build_call_chain(function_key, visited, 0, max_depth)
-    
-    def _build_call_chain(self, function_key: str, visited: Set[str], depth: int, max_depth: int) -> CallChain:
-        """Recursively build call chain"""
-        func_info = self.functions[function_key]
-        chain = CallChain(function=func_info, children=[], depth=depth)
-        
-        if depth >= max_depth or function_key in visited:
-            return chain
-        
-        visited.add(function_key)
-        
-        # Get called functions
-        called_functions = self.call_graph.get(function_key, [])
-        
-        for called_func in called_functions:
-            if called_func in self.functions:
-                child_chain = self._build_call_chain(called_func, visited.copy(), depth + 1, max_depth)
-                chain.children.append(child_chain)
-        
-        return chain
-    
-    def get_all_functions_in_chain(self, call_chain: CallChain) -> List[FunctionInfo]:
+
+        self._chain_cache.clear()
+        visited: Set[int] = set()
+        return self._build_call_chain(self._id_of[function_key], visited, 0, max_depth)
+
+    def _build_call_chain(self, function_id: int, visited: Set[int], depth: int, max_depth: int) -> CallChain:
+        """Build call chain with an explicit stack, memoizing shared subtrees"""
+        # Explicit enter/exit frames avoid Python's recursion limit on deep
+        # call graphs; the cache lets diamond-shaped graphs share subtrees
+        root_holder: List[CallChain] = []
+        stack: List[Tuple] = [("enter", function_id, depth, root_holder)]
+
+        while stack:
+            action, func_id, payload, extra = stack.pop()
+
+            if action != "enter":
+                # Leaving the DFS path: cache the finished subtree, unless
+                # it embeds clips against this specific path
+                visited.remove(func_id)
+                if action != "exit_skip":
+                    self._chain_cache[payload] = extra
+                if action == "exit_full":
+                    self._full_chain_cache[(func_id, extra.depth)] = extra
+                continue
+
+            node_depth, parent_children = payload, extra
+
+            # A subtree is only transplantable between DFS paths when no
+            # on-path node is reachable from it: any overlap means its
+            # internal cycle clips were (or would be) taken against the
+            # specific path active at build time
+            reachable = self._get_reachable(func_id)
+            on_path = func_id in visited
+            path_safe = not on_path and visited.isdisjoint(reachable)
+
+            # A subtree built without any depth clipping is valid at any
+            # depth with enough budget. The longest simple path uses
+            # len(reachable) levels, but a cycle stub hangs one level below
+            # it, so the budget must cover len(reachable) + 1 for every
+            # possible stub to fit
+            unclipped = path_safe and node_depth + len(reachable) + 1 <= max_depth
+            if unclipped:
+                cached_full = self._full_chain_cache.get((func_id, node_depth))
+                if cached_full is not None:
+                    parent_children.append(cached_full)
+                    continue
+
+            # Reuse an already-built subtree when the remaining depth budget
+            # matches, turning the diamond-shaped worst case into O(V+E)
+            cache_key = (func_id, max_depth - node_depth)
+            if path_safe:
+                cached = self._chain_cache.get(cache_key)
+                if cached is not None:
+                    parent_children.append(cached)
+                    continue
+
+            chain = CallChain(function=self._info_of[func_id], children=[], depth=node_depth)
+            parent_children.append(chain)
+
+            if node_depth >= max_depth or on_path:
+                continue
+
+            # Track only the current DFS path for cycle detection
+            visited.add(func_id)
+            if unclipped:
+                exit_action = "exit_full"
+            elif path_safe:
+                exit_action = "exit"
+            else:
+                exit_action = "exit_skip"
+            stack.append((exit_action, func_id, cache_key, chain))
+
+            # Push callees in reverse so children are built in call order;
+            # the adjacency rows only contain resolved ids
+            for called_id in reversed(self._adj[func_id]):
+                stack.append(("enter", called_id, node_depth + 1, chain.children))
+
+        return root_holder[0]
+
+    def _get_reachable(self, function_id: int) -> frozenset:
+        """Get the set of ids reachable from a function, computed once"""
+        cached = self._reachable.get(function_id)
+        if cached is not None:
+            return cached
+
+        seen: Set[int] = set()
+        stack = list(self._adj[function_id])
+        while stack:
+            func_id = stack.pop()
+            if func_id not in seen:
+                seen.add(func_id)
+                stack.extend(self._adj[func_id])
+
+        result = frozenset(seen)
+        self._reachable[function_id] = result
+        return result
+
+    @staticmethod
+    def get_all_functions_in_chain(call_chain: CallChain) -> List[FunctionInfo]:
         """Get all functions in the call chain as a flat list"""
-        # 使用字典来去重，以函数的唯一标识作为key
-        unique_functions = {}
-        self._collect_unique_functions(call_chain, unique_functions)
-        return list(unique_functions.values())
-    
-    def _collect_unique_functions(self, call_chain: CallChain, unique_functions: Dict[str, FunctionInfo]) -> None:
-        """递归收集唯一的函数，避免重复"""
-        # 创建函数的唯一标识：类名.方法名@文件路径:起始行号
-        func_key = f"{call_chain.function.class_name}.{call_chain.function.name}@{call_chain.function.file_path}:{call_chain.function.start_line}"
-        
-        # 如果还没有收集过这个函数，则添加
-        if func_key not in unique_functions:
-            unique_functions[func_key] = call_chain.function
-        
-        # 递归处理子调用链
-        for child in call_chain.children:
-            self._collect_unique_functions(child, unique_functions)
+        # 直接用FunctionInfo对象的id去重（解析器对同一函数复用同一对象），
+        # 避免为每个节点构造字符串key
+        seen_functions: Set[int] = set()
+        functions: List[FunctionInfo] = []
+
+        # 使用显式栈遍历，每个调用链节点最多访问一次
+        seen_chains: Set[int] = {id(call_chain)}
+        stack = [call_chain]
+
+        while stack:
+            chain = stack.pop()
+
+            function_id = id(chain.function)
+            if function_id not in seen_functions:
+                seen_functions.add(function_id)
+                functions.append(chain.function)
+
+            for child in chain.children:
+                if id(child) not in seen_chains:
+                    seen_chains.add(id(child))
+                    stack.append(child)
+
+        return functions
 
 class MermaidGenerator:
     """Generate Mermaid diagrams for function call chains"""
     
     def __init__(self):
         self.node_counter = 0
-        self.node_map: Dict[str, str] = {}
+        # Node ids and labels kept separately so edge emission is a plain
+        # dict lookup with no string slicing
+        self._node_ids: Dict[str, str] = {}
+        self._node_labels: Dict[str, str] = {}
     
     def generate_mermaid_diagram(self, call_chain: CallChain) -> str:
         """Generate Mermaid flowchart diagram from call chain"""
         self.node_counter = 0
-        self.node_map = {}
-        
-        mermaid_lines = ["graph TD"]
-        
-        # First pass: collect all nodes
-        self._collect_all_nodes(call_chain)
-        
-        # Add node definitions
-        for func_key, node_def in self.node_map.items():
-            mermaid_lines.append(f"    {node_def}")
-        
-        # Second pass: generate edges
-        self._generate_mermaid_edges(call_chain, mermaid_lines)
-        
-        return "\n".join(mermaid_lines)
-    
-    def _collect_all_nodes(self, chain: CallChain) -> None:
-        """Collect all nodes in the call chain"""
-        self._get_or_create_node(chain.function)
-        
-        for child in chain.children:
-            self._collect_all_nodes(child)
-    
-    def _generate_mermaid_edges(self, chain: CallChain, mermaid_lines: List[str]) -> None:
-        """Generate edges for the Mermaid diagram"""
-        current_node_id = self._get_node_id(chain.function)
-        
-        for child in chain.children:
-            child_node_id = self._get_node_id(child.function)
-            mermaid_lines.append(f"    {current_node_id} --> {child_node_id}")
-            
-            # Recursively process children
-            self._generate_mermaid_edges(child, mermaid_lines)
-    
-    def _get_node_id(self, func_info: FunctionInfo) -> str:
-        """Get the node ID for a function"""
-        func_key = f"{func_info.class_name}.{func_info.name}"
-        if func_key in self.node_map:
-            return self.node_map[func_key].split('[')[0]
-        return "unknown"
-    
-    def _generate_mermaid_nodes(self, chain: CallChain, mermaid_lines: List[str]) -> str:
-        """Generate Mermaid nodes and edges recursively"""
-        # Create node for current function
-        current_node = self._get_or_create_node(chain.function)
-        
-        # Create nodes for children and connect them
-        for child in chain.children:
-            child_node = self._get_or_create_node(child.function)
-            
-            # Add edge from current to child
-            mermaid_lines.append(f"    {current_node} --> {child_node}")
-            
-            # Recursively process children
-            self._generate_mermaid_nodes(child, mermaid_lines)
-        
-        return current_node
-    
-    def _get_or_create_node(self, func_info: FunctionInfo) -> str:
-        """Get or create a Mermaid node for the function"""
+        self._node_ids = {}
+        self._node_labels = {}
+
+        # Single iterative traversal writing into one output buffer: node
+        # definitions on first use, edges as children are linked
+        buffer = io.StringIO()
+        buffer.write("graph TD")
+
+        seen_chains = {id(call_chain)}
+        stack = [call_chain]
+
+        while stack:
+            chain = stack.pop()
+            current_node_id = self._get_or_create_node(chain.function, buffer)
+
+            # Emit this node's edges in call order
+            for child in chain.children:
+                child_node_id = self._get_or_create_node(child.function, buffer)
+                buffer.write(f"\n    {current_node_id} --> {child_node_id}")
+
+            # Push children in reverse so their subtrees are also visited
+            # in call order (the stack pops the last push first)
+            for child in reversed(chain.children):
+                if id(child) not in seen_chains:
+                    seen_chains.add(id(child))
+                    stack.append(child)
+
+        return buffer.getvalue()
+
+    def _get_or_create_node(self, func_info: FunctionInfo, buffer: io.StringIO) -> str:
+        """Get or create a Mermaid node, writing its definition on first use"""
         func_key = f"{func_info.class_name}.{func_info.name}"
-        
-        if func_key not in self.node_map:
+
+        node_id = self._node_ids.get(func_key)
+        if node_id is None:
             node_id = f"node{self.node_counter}"
             self.node_counter += 1
-            
+
             # Create node label
             label = self._create_node_label(func_info)
-            self.node_map[func_key] = f'{node_id}["{label}"]'
-        
-        return self.node_map[func_key].split('[')[0]  # Return just the node ID
+            self._node_ids[func_key] = node_id
+            self._node_labels[func_key] = label
+            buffer.write(f'\n    {node_id}["{label}"]')
+
+        return node_id
     
     def _create_node_label(self, func_info: FunctionInfo) -> str:
         """Create a readable label for the function node"""
-        label_parts = []
-        
-        # Add REST endpoint info if applicable
+        # Bind attributes once and build the label with a single f-string;
+        # REST endpoints get an extra first line with method and path
+        class_name = func_info.class_name
+        name = func_info.name
+        start_line = func_info.start_line
+        end_line = func_info.end_line
+
         if func_info.is_rest_endpoint:
-            endpoint_info = f"{func_info.http_method} {func_info.endpoint_path}"
-            label_parts.append(endpoint_info)
-        
-        # Add class and method name
-        class_method = f"{func_info.class_name}.{func_info.name}"
-        label_parts.append(class_method)
-        
-        # Add line numbers
-        line_info = f"L{func_info.start_line}-{func_info.end_line}"
-        label_parts.append(line_info)
-        
-        # Join label parts and clean up special characters for Mermaid
-        label = "\\n".join(label_parts)
-        # Remove any problematic character sequences that might appear in Mermaid output
-        label = label.replace("\\nL", "\\n")
-        return label
+            return (f"{func_info.http_method} {func_info.endpoint_path}"
+                    f"\\n{class_name}.{name}\\nL{start_line}-{end_line}")
+
+        return f"{class_name}.{name}\\nL{start_line}-{end_line}"
 
 class ResultFormatter:
     """Format analysis results for output"""
@@ -231,8 +345,7 @@ class ResultFormatter:
     @staticmethod
     def format_call_chain_summary(call_chain: CallChain) -> str:
         """Format call chain summary"""
-        analyzer = CallGraphAnalyzer({})
-        all_functions = analyzer.get_all_functions_in_chain(call_chain)
+        all_functions = CallGraphAnalyzer.get_all_functions_in_chain(call_chain)
         
         output_lines = []
         output_lines.append("=== Call Chain Summary ===")
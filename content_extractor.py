@@ -4,13 +4,15 @@ Content Extractor - 用于提取函数代码内容的工具
 
 主要功能:
     - 从pjt_navigator返回的function_info_json中提取函数代码内容
-    - 将Java代码进行适当的转义以便存储在JSON中
+    - Java代码的转义由最终的json.dumps在序列化时统一完成
 """
 
 import json
+import mmap
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
 # Setup logging
 logging.basicConfig(
@@ -22,36 +24,68 @@ logger = logging.getLogger(__name__)
 
 def escape_java_code(code: str) -> str:
     """
-    将Java代码进行转义，以便安全地存储在JSON中
-    
+    将Java代码进行转义，以便安全地嵌入到JSON字符串字面量中
+
+    注意: java_extract已经不再需要预转义——最终的json.dumps会在
+    序列化时统一完成转义。此函数仅为需要预转义字符串的调用方保留。
+
     Args:
         code: 原始Java代码字符串
-        
+
     Returns:
         str: 转义后的Java代码字符串
     """
     if not code:
         return ""
-    
-    escaped_code = code.replace("\\", "\\\\")   # 反斜杠转义
-    escaped_code = escaped_code.replace("\"", "\\\"")   # 双引号转义
-    escaped_code = escaped_code.replace("/", "\\/")     # 斜杠转义（防止与正则冲突）
-    escaped_code = escaped_code.replace("\n", "\\n")    # 换行符转义
-    escaped_code = escaped_code.replace("\t", "\\t")    # 制表符转义
-    escaped_code = escaped_code.replace("\r", "\\r")    # 回车符转义
-    
-    return escaped_code
+
+    # 直接复用json.dumps的C层转义，去掉首尾的双引号
+    return json.dumps(code, ensure_ascii=False)[1:-1]
+
+
+@lru_cache(maxsize=64)
+def _load_file_index(file_path: str, mtime: float, size: int) -> Tuple[bytes, Tuple[int, ...], int]:
+    """
+    内存映射文件并预计算每行的起始字节偏移
+
+    以(文件路径, 修改时间, 大小)为缓存key，文件未修改时直接复用，
+    提取行范围只需一次bytes切片+解码，无需构造整个行列表。
+
+    Args:
+        file_path: 文件路径
+        mtime: 文件修改时间（参与缓存key，保证失效）
+        size: 文件大小（参与缓存key）
+
+    Returns:
+        Tuple: (内存映射的文件内容, 每行起始偏移, 总行数)
+    """
+    if size == 0:
+        return b'', (0,), 0
+
+    with open(file_path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # 单遍扫描换行符，记录每行的起始偏移
+    offsets = [0]
+    pos = mapped.find(b'\n')
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = mapped.find(b'\n', pos + 1)
+
+    # 文件末尾有换行符时，最后一个偏移指向文件尾，不算作新的一行
+    line_count = len(offsets) - 1 if offsets[-1] == size else len(offsets)
+
+    return mapped, tuple(offsets), line_count
 
 
 def read_code_lines(file_path: str, start_line: int, end_line: int) -> Optional[str]:
     """
     从文件中读取指定行范围的代码
-    
+
     Args:
         file_path: 文件路径
         start_line: 开始行号（从1开始）
         end_line: 结束行号（包含）
-        
+
     Returns:
         Optional[str]: 代码内容，如果文件不存在或读取失败则返回None
     """
@@ -59,32 +93,40 @@ def read_code_lines(file_path: str, start_line: int, end_line: int) -> Optional[
         if not os.path.exists(file_path):
             logger.error(f"文件不存在: {file_path}")
             return None
-            
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            
+
+        stat = os.stat(file_path)
+        mapped, offsets, line_count = _load_file_index(file_path, stat.st_mtime, stat.st_size)
+
         # 检查行号范围是否有效
-        if start_line < 1 or end_line > len(lines) or start_line > end_line:
-            logger.error(f"无效的行号范围: {start_line}-{end_line}，文件总行数: {len(lines)}")
+        if start_line < 1 or end_line > line_count or start_line > end_line:
+            logger.error(f"无效的行号范围: {start_line}-{end_line}，文件总行数: {line_count}")
             return None
-            
-        # 提取指定范围的行（注意：列表索引从0开始，行号从1开始）
-        selected_lines = lines[start_line-1:end_line]
-        
-        # 合并行并返回
-        return ''.join(selected_lines)
-        
+
+        # 提取指定范围的字节并解码（注意：偏移索引从0开始，行号从1开始）
+        start = offsets[start_line - 1]
+        end = offsets[end_line] if end_line < len(offsets) else stat.st_size
+        return mapped[start:end].decode('utf-8')
+
     except Exception as e:
         logger.error(f"读取文件时发生错误 {file_path}: {e}")
         return None
 
 
-def java_extract(function_info_json: str) -> str:
+def _dumps(obj: Any, pretty: bool) -> str:
+    """按需选择紧凑或美化的JSON序列化"""
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    # 紧凑分隔符走C加速的快速路径，序列化结果也明显更小
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def java_extract(function_info_json: str, pretty: bool = False) -> str:
     """
     从pjt_navigator返回的function_info_json中提取Java函数代码内容
     
     Args:
         function_info_json: pjt_navigator方法返回的第二个结果（字符串格式的JSON）
+        pretty: 是否美化输出（默认False，输出紧凑JSON以走序列化快速路径）
         
     Returns:
         str: 包含函数名称和代码内容的JSON字符串
@@ -96,24 +138,24 @@ def java_extract(function_info_json: str) -> str:
         # 检查是否包含错误信息
         if "error" in function_info:
             logger.error(f"输入的function_info_json包含错误: {function_info['error']}")
-            return json.dumps({"error": function_info["error"]}, indent=2, ensure_ascii=False)
+            return _dumps({"error": function_info["error"]}, pretty)
         
         # 2. 提取其中的functions列表
         if "functions" not in function_info:
             error_msg = "function_info_json中没有找到functions字段"
             logger.error(error_msg)
-            return json.dumps({"error": error_msg}, indent=2, ensure_ascii=False)
+            return _dumps({"error": error_msg}, pretty)
             
         functions_list = function_info["functions"]
         
         if not functions_list:
             error_msg = "functions列表为空"
             logger.error(error_msg)
-            return json.dumps({"error": error_msg}, indent=2, ensure_ascii=False)
+            return _dumps({"error": error_msg}, pretty)
         
         # 3. 遍历functions列表，提取代码内容
         result_functions = []
-        
+
         for func in functions_list:
             try:
                 # 获取函数信息
@@ -136,20 +178,17 @@ def java_extract(function_info_json: str) -> str:
                     logger.warning(f"函数 {full_function_name} 缺少必要的位置信息，跳过")
                     continue
                 
-                # 读取代码内容
+                # 读取代码内容（同一文件复用缓存的mmap和行偏移索引）
                 code_content = read_code_lines(file_path, start_line, end_line)
-                
+
                 if code_content is None:
                     logger.warning(f"无法读取函数 {full_function_name} 的代码内容，跳过")
                     continue
                 
-                # 转义Java代码
-                escaped_code = escape_java_code(code_content)
-                
-                # 添加到结果中
+                # 直接存入原始代码，最终的json.dumps会统一完成转义
                 result_functions.append({
                     "function_name": full_function_name,
-                    "code_contents": escaped_code
+                    "code_contents": code_content
                 })
                 
                 logger.info(f"成功提取函数 {full_function_name} 的代码内容")
@@ -162,22 +201,22 @@ def java_extract(function_info_json: str) -> str:
         if not result_functions:
             error_msg = "没有成功提取到任何函数的代码内容"
             logger.error(error_msg)
-            return json.dumps({"error": error_msg}, indent=2, ensure_ascii=False)
+            return _dumps({"error": error_msg}, pretty)
         
         logger.info(f"成功提取了 {len(result_functions)} 个函数的代码内容")
         
         # 返回结果JSON
-        return json.dumps(result_functions, indent=2, ensure_ascii=False)
+        return _dumps(result_functions, pretty)
         
     except json.JSONDecodeError as e:
         error_msg = f"解析function_info_json时发生错误: {e}"
         logger.error(error_msg)
-        return json.dumps({"error": error_msg}, indent=2, ensure_ascii=False)
+        return _dumps({"error": error_msg}, pretty)
         
     except Exception as e:
         error_msg = f"提取代码内容时发生错误: {e}"
         logger.error(error_msg)
-        return json.dumps({"error": error_msg}, indent=2, ensure_ascii=False)
+        return _dumps({"error": error_msg}, pretty)
 
 
 def main():
@@ -206,8 +245,8 @@ def main():
         print("pjt_navigator没有返回函数信息")
         sys.exit(1)
     
-    # 提取代码内容
-    result = java_extract(function_info_json)
+    # 提取代码内容（命令行输出给人看，使用美化格式）
+    result = java_extract(function_info_json, pretty=True)
     
     print("代码提取结果:")
     print("="*60)
@@ -26,6 +26,12 @@ from typing import List, Optional, Tuple, Dict
 from java_parser import JavaParser, FunctionInfo
 from call_graph_analyzer import CallGraphAnalyzer, MermaidGenerator, ResultFormatter
 
+# orjson（Rust实现）序列化大结果明显更快，不可用时回退到标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,6 +42,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _dumps_indented(obj) -> str:
+    """序列化为带缩进的JSON字符串（优先使用orjson的原生实现）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+# 错误提示中最多列出的可用函数数量，避免在大工程上为错误路径构造巨型列表
+_AVAILABLE_FUNCTIONS_LIMIT = 200
+
+# 缓存已解析的项目: 项目绝对路径 -> (Java文件最新修改时间, functions, analyzer)
+_analyzer_cache: Dict[str, Tuple[float, Dict[str, FunctionInfo], CallGraphAnalyzer]] = {}
+
+def _latest_java_mtime(project_dir: str) -> float:
+    """获取项目中Java文件的最新修改时间，用于判断缓存是否失效"""
+    latest = 0.0
+    for root, dirs, files in os.walk(project_dir):
+        for file in files:
+            if file.endswith('.java'):
+                try:
+                    mtime = os.path.getmtime(os.path.join(root, file))
+                except OSError:
+                    continue
+                if mtime > latest:
+                    latest = mtime
+    return latest
+
+def _get_analyzer(project_dir: str) -> Tuple[Dict[str, FunctionInfo], CallGraphAnalyzer]:
+    """获取项目的解析结果和调用图分析器（带缓存）
+
+    以项目路径为key缓存解析结果，只要Java文件没有修改，
+    重复调用pjt_navigator时不再重新解析整个工程。
+    """
+    cache_key = os.path.abspath(project_dir)
+    tree_mtime = _latest_java_mtime(project_dir)
+
+    cached = _analyzer_cache.get(cache_key)
+    if cached is not None and cached[0] == tree_mtime:
+        logger.info(f"使用缓存的解析结果: {project_dir}")
+        return cached[1], cached[2]
+
+    parser = JavaParser()
+    functions = parser.parse_project(project_dir)
+    analyzer = CallGraphAnalyzer(functions)
+    _analyzer_cache[cache_key] = (tree_mtime, functions, analyzer)
+    return functions, analyzer
+
 def validate_project_directory(project_dir: str) -> bool:
     """验证项目目录是否有效"""
     if not os.path.exists(project_dir):
@@ -73,24 +125,23 @@ def pjt_navigator(start_point: str, project_dir: str, max_depth: int = 10) -> Tu
         
         logger.info(f"开始解析Java工程: {project_dir}")
         
-        # 初始化解析器并解析项目
-        parser = JavaParser()
-        functions = parser.parse_project(project_dir)
-        
+        # 获取解析结果和分析器（同一项目未修改时直接复用缓存）
+        functions, analyzer = _get_analyzer(project_dir)
+
         if not functions:
             raise ValueError("在工程中没有找到任何函数")
-        
+
         logger.info(f"成功解析到 {len(functions)} 个函数")
         
-        # 初始化分析器
-        analyzer = CallGraphAnalyzer(functions)
-        
         # 查找匹配的函数
         matching_functions = analyzer.find_function_by_name(start_point)
         
         if not matching_functions:
+            # 只列出前N个函数，报错展示不需要完整的函数清单
             available_functions = []
             for func_key, func_info in functions.items():
+                if len(available_functions) >= _AVAILABLE_FUNCTIONS_LIMIT:
+                    break
                 if func_info.is_rest_endpoint:
                     available_functions.append({
                         "name": func_key,
@@ -103,12 +154,15 @@ def pjt_navigator(start_point: str, project_dir: str, max_depth: int = 10) -> Tu
                         "name": func_key,
                         "type": "FUNCTION"
                     })
-            
+
             error_info = {
                 "error": f"没有找到匹配的函数: {start_point}",
                 "available_functions": available_functions
             }
-            return "", json.dumps(error_info, indent=2, ensure_ascii=False)
+            omitted = len(functions) - len(available_functions)
+            if omitted > 0:
+                error_info["omitted_functions"] = omitted
+            return "", _dumps_indented(error_info)
         
         # 使用第一个匹配的函数
         target_function = matching_functions[0]
@@ -125,7 +179,7 @@ def pjt_navigator(start_point: str, project_dir: str, max_depth: int = 10) -> Tu
             error_info = {
                 "error": f"无法获取函数调用链: {target_function}"
             }
-            return "", json.dumps(error_info, indent=2, ensure_ascii=False)
+            return "", _dumps_indented(error_info)
         
         # 生成Mermaid图表
         mermaid_generator = MermaidGenerator()
@@ -160,7 +214,7 @@ def pjt_navigator(start_point: str, project_dir: str, max_depth: int = 10) -> Tu
             "functions": functions_info
         }
         
-        function_info_json = json.dumps(result, indent=2, ensure_ascii=False)
+        function_info_json = _dumps_indented(result)
         
         return mermaid_diagram, function_info_json
         
@@ -171,7 +225,7 @@ def pjt_navigator(start_point: str, project_dir: str, max_depth: int = 10) -> Tu
             "start_point": start_point,
             "project_dir": project_dir
         }
-        return "", json.dumps(error_info, indent=2, ensure_ascii=False)
+        return "", _dumps_indented(error_info)
 
 def parse_arguments() -> argparse.Namespace:
     """解析命令行参数"""
@@ -245,6 +299,8 @@ def main():
                             print(f"  {func['name']} (REST: {func['method']} {func['path']})")
                         else:
                             print(f"  {func['name']}")
+                    if result.get("omitted_functions"):
+                        print(f"  ... 以及另外 {result['omitted_functions']} 个函数")
                 sys.exit(1)
         except json.JSONDecodeError:
             pass
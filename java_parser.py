@@ -1,16 +1,28 @@
 import os
-import re
+import sys
 import json
+import hashlib
+import pickle
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Set, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 import logging
 import javalang
 
+# orjson serializes large function maps several times faster than the
+# standard library; fall back to json when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInfo:
     """Function information structure"""
     name: str
@@ -26,9 +38,22 @@ class FunctionInfo:
     
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        # asdict recursively deep-copies every field; all fields here are
+        # flat, so a handwritten dict (with one shallow list copy) suffices
+        return {
+            'name': self.name,
+            'class_name': self.class_name,
+            'file_path': self.file_path,
+            'start_line': self.start_line,
+            'end_line': self.end_line,
+            'called_functions': list(self.called_functions),
+            'is_public': self.is_public,
+            'is_rest_endpoint': self.is_rest_endpoint,
+            'endpoint_path': self.endpoint_path,
+            'http_method': self.http_method,
+        }
 
-@dataclass
+@dataclass(slots=True)
 class ClassInfo:
     """Class information structure"""
     name: str
@@ -37,6 +62,69 @@ class ClassInfo:
     functions: List[FunctionInfo]
     imports: List[str]
 
+# Minimum file count before spinning up worker processes; below this the
+# pool startup cost outweighs the parallel parsing win
+_PARALLEL_THRESHOLD = 50
+
+# Directory names skipped during Java file discovery: test/resource trees,
+# build output, generated and vendored sources, and tool metadata
+_EXCLUDE_DIRS = {
+    'test', 'tests', 'resources', 'resource', 'target', 'build', 'out',
+    'generated', 'generated-sources', 'node_modules',
+    '.git', '.gradle', '.idea', '.mvn', '.java_navigator_cache',
+}
+
+# Spring Boot mapping annotations -> HTTP method
+_SPRING_BOOT_MAPPINGS = {
+    'GetMapping': 'GET',
+    'PostMapping': 'POST',
+    'PutMapping': 'PUT',
+    'DeleteMapping': 'DELETE',
+    'PatchMapping': 'PATCH',
+    'RequestMapping': 'REQUEST'
+}
+
+# JAX-RS annotations (including jakarta.ws.rs.Path) -> HTTP method
+_JAXRS_MAPPINGS = {
+    'GET': 'GET',
+    'POST': 'POST',
+    'PUT': 'PUT',
+    'DELETE': 'DELETE',
+    'PATCH': 'PATCH'
+}
+
+# Object-protocol methods ignored when collecting call relationships
+_KEYWORDS_TO_SKIP = frozenset({
+    'equals', 'toString', 'hashCode', 'clone', 'finalize',
+    'getClass', 'notify', 'notifyAll', 'wait'
+})
+
+# Unified REST-annotation dispatch: name -> (HTTP method, carries path).
+# Spring mapping annotations carry the path in their value; bare JAX-RS
+# method annotations do not; @Path carries a path but only implies
+# REQUEST when no method annotation claims one first
+_ANNOTATION_DISPATCH: Dict[str, Tuple[str, bool]] = {
+    **{name: (method, True) for name, method in _SPRING_BOOT_MAPPINGS.items()},
+    **{name: (method, False) for name, method in _JAXRS_MAPPINGS.items()},
+    'Path': ('', True),
+}
+
+# Annotation element extractors dispatched on the element's exact type;
+# a dict lookup on type() replaces per-annotation isinstance chains
+_ANNOTATION_ELEMENT_HANDLERS = {
+    javalang.tree.Literal: lambda element: element.value.strip('"\''),
+}
+
+# Bump to invalidate on-disk parse caches when the parser output changes
+_CACHE_VERSION = 2
+
+# Directory (inside the analyzed project) holding per-file parse caches
+_CACHE_DIR_NAME = '.java_navigator_cache'
+
+def _parse_file_worker(file_path: str) -> List['ClassInfo']:
+    """Parse one Java file in a worker process (must stay module-level picklable)"""
+    return JavaParser()._parse_java_file_with_javalang(file_path)
+
 class JavaParser:
     """Java code parser using javalang for extracting function call relationships"""
     
@@ -44,7 +132,10 @@ class JavaParser:
         self.classes: Dict[str, ClassInfo] = {}
         self.functions: Dict[str, FunctionInfo] = {}
         self.src_main_path: str = ""
-        self.package_to_file_map: Dict[str, str] = {}
+        self._cache_dir: str = ""
+        # Next suffix per duplicated function key, so collision handling
+        # stays O(1) instead of re-probing every previously used suffix
+        self._dup_counters: Dict[str, int] = {}
         
     def parse_project(self, project_path: str) -> Dict[str, FunctionInfo]:
         """Parse entire Java project and extract function information"""
@@ -64,135 +155,255 @@ class JavaParser:
         java_files = self._find_java_files(self.src_main_path)
         logger.info(f"Found {len(java_files)} Java files")
         
-        # Parse each Java file using javalang
+        # Serve unchanged files from the on-disk parse cache first
+        self._cache_dir = os.path.join(project_path, _CACHE_DIR_NAME)
+        to_parse = []
         for java_file in java_files:
-            self._parse_java_file_with_javalang(java_file)
-            
+            cached = self._load_cached_classes(java_file)
+            if cached is not None:
+                self._register_parsed_classes(cached)
+            else:
+                to_parse.append(java_file)
+
+        if len(to_parse) < len(java_files):
+            logger.info(f"Loaded {len(java_files) - len(to_parse)} files from parse cache")
+
+        # Parse the remaining files using javalang; files are independent
+        # until resolution, so large projects parse in parallel workers
+        if len(to_parse) > _PARALLEL_THRESHOLD:
+            with ProcessPoolExecutor() as executor:
+                for java_file, class_infos in zip(to_parse, executor.map(_parse_file_worker, to_parse, chunksize=32)):
+                    self._store_cached_classes(java_file, class_infos)
+                    self._register_parsed_classes(class_infos)
+        else:
+            for java_file in to_parse:
+                class_infos = self._parse_java_file_with_javalang(java_file)
+                self._store_cached_classes(java_file, class_infos)
+                self._register_parsed_classes(class_infos)
+
         # Resolve function calls after all files are parsed
         self._resolve_function_calls()
-        
+
         return self.functions
     
+    def _cache_path(self, file_path: str) -> str:
+        """Cache file location for a source file"""
+        digest = hashlib.blake2b(file_path.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self._cache_dir, f"{digest}.pickle")
+
+    def _load_cached_classes(self, file_path: str) -> Optional[List[ClassInfo]]:
+        """Load cached parse results for a file if still current"""
+        try:
+            stat = os.stat(file_path)
+            with open(self._cache_path(file_path), 'rb') as f:
+                payload = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError):
+            return None
+
+        if (payload.get('version') != _CACHE_VERSION
+                or payload.get('key') != (stat.st_mtime_ns, stat.st_size)):
+            return None
+
+        return payload.get('classes')
+
+    def _store_cached_classes(self, file_path: str, class_infos: List[ClassInfo]) -> None:
+        """Write parse results for a file to the on-disk cache"""
+        try:
+            stat = os.stat(file_path)
+            os.makedirs(self._cache_dir, exist_ok=True)
+            payload = {
+                'version': _CACHE_VERSION,
+                'key': (stat.st_mtime_ns, stat.st_size),
+                'classes': class_infos,
+            }
+            with open(self._cache_path(file_path), 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.warning(f"Cannot write parse cache for {file_path}: {e}")
+
     def _find_java_files(self, directory: str) -> List[str]:
         """Find all Java files in directory recursively, excluding test and resource directories"""
-        java_files = []
-        exclude_dirs = {'test', 'tests', 'resources', 'resource', 'target', 'build'}
-        
-        for root, dirs, files in os.walk(directory):
-            # Remove excluded directories from traversal
-            dirs[:] = [d for d in dirs if d.lower() not in exclude_dirs]
-            
-            for file in files:
-                if file.endswith('.java'):
-                    java_files.append(os.path.join(root, file))
-        return java_files
+        return list(self._iter_java_files(directory))
+
+    def _iter_java_files(self, directory: str):
+        """Yield Java file paths using scandir's cached DirEntry type info"""
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            logger.warning(f"Cannot scan directory {directory}: {e}")
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Skip excluded directories without descending into them
+                    if entry.name.lower() not in _EXCLUDE_DIRS:
+                        yield from self._iter_java_files(entry.path)
+                elif entry.name.endswith('.java'):
+                    yield entry.path
     
-    def _parse_java_file_with_javalang(self, file_path: str) -> None:
-        """Parse a single Java file using javalang"""
+    def _parse_java_file_with_javalang(self, file_path: str) -> List[ClassInfo]:
+        """Parse a single Java file using javalang and return its classes
+
+        This stage touches no parser state, so it can run in a worker
+        process; merging happens in _register_parsed_classes.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
+            # Read raw bytes and decode once; javalang's tokenizer needs a
+            # str, so a full bytes pipeline is not possible, but this skips
+            # the text-mode newline translation layer
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+
+            # Files declaring no type (package-info.java, module-info.java)
+            # have nothing to extract; three byte scans are orders of
+            # magnitude cheaper than handing them to javalang
+            if (b'class' not in raw and b'interface' not in raw and b'enum' not in raw):
+                logger.debug(f"Skipping file with no type declarations: {file_path}")
+                return []
+
+            # ASCII decode is a near-memcpy, and Java source is ASCII in
+            # the common case; fall back to full UTF-8 validation otherwise
+            content = raw.decode('ascii') if raw.isascii() else raw.decode('utf-8')
+
             logger.info(f"Parsing file: {file_path}")
-            
+
             # Parse using javalang
             try:
                 tree = javalang.parse.parse(content)
             except Exception as e:
                 logger.warning(f"Failed to parse {file_path} with javalang: {e}")
-                return
-            
+                return []
+
             # Extract package information
             package = tree.package.name if tree.package else ""
-            
+
             # Extract imports
             imports = []
             if tree.imports:
                 for import_decl in tree.imports:
                     imports.append(import_decl.path)
-            
-            # Process each class/interface declaration
-            for path, node in tree.filter(javalang.tree.ClassDeclaration):
-                self._process_class_declaration(node, file_path, package, imports, content)
-                
-            for path, node in tree.filter(javalang.tree.InterfaceDeclaration):
-                self._process_class_declaration(node, file_path, package, imports, content)
-                    
+
+            # Tokenize once per file to locate braces: separator tokens carry
+            # line numbers and exclude braces inside comments and string
+            # literals, which a raw text scan would miscount
+            brace_tokens = self._collect_brace_tokens(content, file_path)
+
+            # Process class and interface declarations in one AST walk
+            # (filter only takes a single type here, and each filter call
+            # re-traverses the whole tree)
+            class_infos = []
+            declaration_types = (javalang.tree.ClassDeclaration, javalang.tree.InterfaceDeclaration)
+            for path, node in tree:
+                if isinstance(node, declaration_types):
+                    class_infos.append(self._build_class_info(node, file_path, package, imports, brace_tokens))
+
+            return class_infos
+
         except Exception as e:
             logger.error(f"Error parsing file {file_path}: {e}")
-    
-    def _process_class_declaration(self, class_node, file_path: str, package: str, imports: List[str], content: str) -> None:
-        """Process a class declaration and extract its methods"""
+            return []
+
+    def _collect_brace_tokens(self, content: str, file_path: str) -> List[Tuple[int, bool]]:
+        """Collect (line, is_open) for every brace token in the file"""
+        brace_tokens: List[Tuple[int, bool]] = []
+        try:
+            for token in javalang.tokenizer.tokenize(content):
+                if isinstance(token, javalang.tokenizer.Separator):
+                    if token.value == '{':
+                        brace_tokens.append((token.position[0], True))
+                    elif token.value == '}':
+                        brace_tokens.append((token.position[0], False))
+        except Exception as e:
+            logger.warning(f"Failed to tokenize {file_path} for brace positions: {e}")
+        return brace_tokens
+
+    def _build_class_info(self, class_node, file_path: str, package: str, imports: List[str], brace_tokens: List[Tuple[int, bool]]) -> ClassInfo:
+        """Build a ClassInfo (with its methods) from a class declaration"""
         class_name = class_node.name
-        full_class_name = f"{package}.{class_name}" if package else class_name
-        
-        # Store package to file mapping
-        self.package_to_file_map[full_class_name] = file_path
-        
+
         # Extract methods from the class
         functions = []
-        
+
         # Get class-level annotations for REST controllers
-        class_annotations = self._extract_annotations(class_node.annotations) if class_node.annotations else {}
-        class_rest_mapping = class_annotations.get('RequestMapping', '') or class_annotations.get('Path', '')
-        
+        class_annotations = self._extract_annotations(class_node.annotations)
+        class_rest_mapping = (next((value for name, value in class_annotations if name == 'RequestMapping'), '')
+                              or next((value for name, value in class_annotations if name == 'Path'), ''))
+
         for method_node in class_node.body:
             if isinstance(method_node, javalang.tree.MethodDeclaration):
-                func_info = self._process_method_declaration(method_node, class_name, file_path, content, class_rest_mapping)
+                func_info = self._process_method_declaration(method_node, class_name, file_path, brace_tokens, class_rest_mapping)
                 if func_info:
                     functions.append(func_info)
-        
-        # Create class info
-        class_info = ClassInfo(
+
+        return ClassInfo(
             name=class_name,
             file_path=file_path,
             package=package,
             functions=functions,
             imports=imports
         )
-        
-        self.classes[class_name] = class_info
-        
-        # Add functions to global function map with deduplication
-        for func in functions:
-            func_key = f"{class_name}.{func.name}"
-            # Check for duplicates (same name, file_path, start_line, end_line)
-            if func_key in self.functions:
-                existing_func = self.functions[func_key]
-                if (existing_func.file_path == func.file_path and 
-                    existing_func.start_line == func.start_line and 
-                    existing_func.end_line == func.end_line):
-                    logger.warning(f"Skipping duplicate function: {func_key} in {func.file_path}:{func.start_line}-{func.end_line}")
-                    continue
-                else:
-                    # Different implementation, use a unique key
-                    counter = 1
-                    unique_key = f"{func_key}_{counter}"
-                    while unique_key in self.functions:
-                        counter += 1
+
+    def _register_parsed_classes(self, class_infos: List[ClassInfo]) -> None:
+        """Merge parsed classes into the parser state with deduplication"""
+        for class_info in class_infos:
+            # Intern the strings repeated across every method of a class
+            # (worker processes return fresh copies after unpickling), so
+            # one str object is shared and dict keys hash on identity
+            class_name = sys.intern(class_info.name)
+            file_path = sys.intern(class_info.file_path)
+            # Packages repeat across most classes in a project; share one
+            # str object instead of a fresh copy per unpickled ClassInfo
+            class_info.package = sys.intern(class_info.package)
+
+            self.classes[class_name] = class_info
+
+            # Add functions to global function map with deduplication
+            for func in class_info.functions:
+                func.class_name = class_name
+                func.file_path = file_path
+                func_key = sys.intern(f"{class_name}.{func.name}")
+                # Check for duplicates (same name, file_path, start_line, end_line)
+                if func_key in self.functions:
+                    existing_func = self.functions[func_key]
+                    if (existing_func.file_path == func.file_path and
+                        existing_func.start_line == func.start_line and
+                        existing_func.end_line == func.end_line):
+                        logger.warning(f"Skipping duplicate function: {func_key} in {func.file_path}:{func.start_line}-{func.end_line}")
+                        continue
+                    else:
+                        # Different implementation, use a unique key; the
+                        # counter makes this O(1) amortized, but still probe
+                        # self.functions so the suffix never collides with a
+                        # real method literally named e.g. method_1
+                        counter = self._dup_counters.get(func_key, 0) + 1
                         unique_key = f"{func_key}_{counter}"
-                    func_key = unique_key
-                    logger.info(f"Found function with same name but different location, using unique key: {func_key}")
-            
-            self.functions[func_key] = func
+                        while unique_key in self.functions:
+                            counter += 1
+                            unique_key = f"{func_key}_{counter}"
+                        self._dup_counters[func_key] = counter
+                        func_key = sys.intern(unique_key)
+                        logger.info(f"Found function with same name but different location, using unique key: {func_key}")
+
+                self.functions[func_key] = func
     
-    def _process_method_declaration(self, method_node, class_name: str, file_path: str, content: str, class_rest_mapping: str = "") -> Optional[FunctionInfo]:
+    def _process_method_declaration(self, method_node, class_name: str, file_path: str, brace_tokens: List[Tuple[int, bool]], class_rest_mapping: str = "") -> Optional[FunctionInfo]:
         """Process a method declaration and extract its information"""
         method_name = method_node.name
-        
+
         # Skip constructors
         if method_name == class_name:
             return None
-        
+
         # Get method position
         start_line = method_node.position.line if method_node.position else 1
-        end_line = self._find_method_end_line(content, start_line)
+        end_line = self._find_method_end_line(brace_tokens, start_line)
         
-        # Check if method is public
-        is_public = any(modifier == 'public' for modifier in method_node.modifiers) if method_node.modifiers else False
+        # Check if method is public (modifiers is a set, so probe it directly)
+        is_public = 'public' in method_node.modifiers if method_node.modifiers else False
         
         # Extract method annotations for REST endpoints
-        method_annotations = self._extract_annotations(method_node.annotations) if method_node.annotations else {}
+        method_annotations = self._extract_annotations(method_node.annotations)
         
         # Check for REST endpoint annotations (Spring Boot and JAX-RS)
         is_rest_endpoint, endpoint_path, http_method = self._check_rest_endpoint_annotations(method_annotations, class_rest_mapping)
@@ -213,69 +424,58 @@ class JavaParser:
             http_method=http_method
         )
     
-    def _extract_annotations(self, annotations) -> Dict[str, str]:
-        """Extract annotations from javalang annotation nodes"""
-        annotation_dict = {}
+    def _extract_annotations(self, annotations) -> List[Tuple[str, str]]:
+        """Extract (name, value) pairs from javalang annotation nodes
+
+        Most methods carry zero or one annotation, so a small list of
+        pairs beats allocating a dict per method; callers scan it
+        linearly.
+        """
+        annotation_pairs: List[Tuple[str, str]] = []
         if not annotations:
-            return annotation_dict
-            
+            return annotation_pairs
+
         for annotation in annotations:
-            annotation_name = annotation.name
-            
-            # Handle different annotation types
-            if hasattr(annotation, 'element') and annotation.element:
-                if isinstance(annotation.element, javalang.tree.Literal):
-                    annotation_dict[annotation_name] = annotation.element.value.strip('"\'')
-                elif hasattr(annotation.element, 'value'):
-                    annotation_dict[annotation_name] = annotation.element.value
-            else:
-                annotation_dict[annotation_name] = ""
-                
-        return annotation_dict
+            # The same few annotation names repeat across every controller;
+            # intern them so later lookups compare by pointer
+            annotation_name = sys.intern(annotation.name)
+
+            element = getattr(annotation, 'element', None)
+            if not element:
+                annotation_pairs.append((annotation_name, ""))
+                continue
+
+            handler = _ANNOTATION_ELEMENT_HANDLERS.get(type(element))
+            if handler is not None:
+                annotation_pairs.append((annotation_name, handler(element)))
+            elif hasattr(element, 'value'):
+                annotation_pairs.append((annotation_name, element.value))
+
+        return annotation_pairs
     
-    def _check_rest_endpoint_annotations(self, annotations: Dict[str, str], class_rest_mapping: str = "") -> Tuple[bool, str, str]:
+    def _check_rest_endpoint_annotations(self, annotations: List[Tuple[str, str]], class_rest_mapping: str = "") -> Tuple[bool, str, str]:
         """Check if method has REST endpoint annotations (Spring Boot + JAX-RS)"""
-        spring_boot_mappings = {
-            'GetMapping': 'GET',
-            'PostMapping': 'POST',
-            'PutMapping': 'PUT',
-            'DeleteMapping': 'DELETE',
-            'PatchMapping': 'PATCH',
-            'RequestMapping': 'REQUEST'
-        }
-        
-        # JAX-RS annotations (including jakarta.ws.rs.Path)
-        jaxrs_mappings = {
-            'GET': 'GET',
-            'POST': 'POST',
-            'PUT': 'PUT',
-            'DELETE': 'DELETE',
-            'PATCH': 'PATCH'
-        }
-        
         endpoint_path = ""
         http_method = ""
-        
-        # Check Spring Boot annotations
-        for annotation_name, method in spring_boot_mappings.items():
-            if annotation_name in annotations:
-                endpoint_path = annotations[annotation_name]
+        saw_path = False
+
+        # Single pass over the annotations through the unified dispatch
+        # table; first method and first path win, and a bare @Path only
+        # falls back to REQUEST when no method annotation appeared
+        for annotation_name, value in annotations:
+            dispatch = _ANNOTATION_DISPATCH.get(annotation_name)
+            if dispatch is None:
+                continue
+            method, carries_path = dispatch
+            if method and not http_method:
                 http_method = method
-                break
-        
-        # Check JAX-RS annotations
-        if not http_method:
-            for annotation_name, method in jaxrs_mappings.items():
-                if annotation_name in annotations:
-                    http_method = method
-                    break
-        
-        # Check for @Path annotation (JAX-RS)
-        if 'Path' in annotations:
-            if not endpoint_path:
-                endpoint_path = annotations['Path']
-            if not http_method:
-                http_method = 'REQUEST'  # Default for @Path
+            if carries_path and not endpoint_path:
+                endpoint_path = value
+            if annotation_name == 'Path':
+                saw_path = True
+
+        if saw_path and not http_method:
+            http_method = 'REQUEST'  # Default for @Path
         
         # Combine class and method paths
         if class_rest_mapping and endpoint_path:
@@ -285,36 +485,38 @@ class JavaParser:
         
         return bool(http_method), endpoint_path, http_method
     
-    def _find_method_end_line(self, content: str, start_line: int) -> int:
-        """Find the end line of a method by counting braces"""
-        lines = content.split('\n')
-        if start_line > len(lines):
-            return start_line
-        
+    def _find_method_end_line(self, brace_tokens: List[Tuple[int, bool]], start_line: int) -> int:
+        """Find the end line of a method by matching its braces
+
+        Works over the brace tokens collected by _collect_brace_tokens, so
+        braces inside comments and string literals never skew the count and
+        no fixed-length fallback is needed.
+        """
+        # First brace token at or after the method's start line; the
+        # 1-tuple probe compares on line number only, so same-line token
+        # order does not matter
+        index = bisect_left(brace_tokens, (start_line,))
+
         brace_count = 0
-        found_opening_brace = False
-        
-        for i in range(start_line - 1, len(lines)):
-            line = lines[i]
-            
-            # Count braces
-            for char in line:
-                if char == '{':
-                    brace_count += 1
-                    found_opening_brace = True
-                elif char == '}':
-                    brace_count -= 1
-                    
-            # If we found opening brace and braces are balanced, we found the end
-            if found_opening_brace and brace_count == 0:
-                return i + 1
-        
-        return start_line + 10  # Fallback
+        for line, is_open in brace_tokens[index:]:
+            if is_open:
+                brace_count += 1
+            else:
+                brace_count -= 1
+                if brace_count == 0:
+                    return line
+
+        # Abstract/interface methods have no body; unmatched braces mean a
+        # malformed file — either way the declaration line is the best answer
+        return start_line
     
     def _extract_function_calls_from_method(self, method_node) -> List[str]:
         """Extract function calls from method node using javalang AST"""
-        calls = []
-        
+        # A dict used as an ordered set dedupes during collection, so
+        # repeated calls never pile up in an intermediate list; first-seen
+        # order keeps downstream output like the Mermaid diagram deterministic
+        calls: Dict[str, None] = {}
+
         # Traverse the AST to find method invocations
         for path, node in method_node.filter(javalang.tree.MethodInvocation):
             if hasattr(node, 'member') and hasattr(node, 'qualifier'):
@@ -322,83 +524,94 @@ class JavaParser:
                     # Object method call: object.method()
                     qualifier_name = self._get_node_name(node.qualifier)
                     if qualifier_name and qualifier_name not in ['this', 'super']:
-                        call = f"{qualifier_name}.{node.member}"
-                        calls.append(call)
+                        calls[f"{qualifier_name}.{node.member}"] = None
                 else:
                     # Direct method call: method()
-                    calls.append(node.member)
-        
-        # Remove duplicates and filter out common keywords
+                    calls[node.member] = None
+
+        # Filter keywords and accessor-style qualified calls
         filtered_calls = []
-        keywords_to_skip = {
-            'equals', 'toString', 'hashCode', 'clone', 'finalize',
-            'getClass', 'notify', 'notifyAll', 'wait'
-        }
-        
-        for call in set(calls):
+
+        for call in calls:
             if '.' in call:
                 obj_name, method_name = call.split('.', 1)
-                if (method_name not in keywords_to_skip and 
+                if (method_name not in _KEYWORDS_TO_SKIP and
                     len(method_name) > 1 and
-                    not method_name.startswith('get') and
-                    not method_name.startswith('set') and
-                    not method_name.startswith('is')):
+                    not method_name.startswith(('get', 'set', 'is'))):
                     filtered_calls.append(call)
-            elif call not in keywords_to_skip:
+            elif call not in _KEYWORDS_TO_SKIP:
                 filtered_calls.append(call)
                 
         return filtered_calls
     
     def _get_node_name(self, node) -> Optional[str]:
         """Get the name from an AST node"""
+        # Qualifiers are nearly always plain strings or MemberReference
+        # nodes; exact-type checks hit those without the hasattr
+        # try/except machinery, with a generic fallback for the rest
+        node_type = type(node)
+        if node_type is str:
+            return node
+        if node_type is javalang.tree.MemberReference or node_type is javalang.tree.MethodInvocation:
+            return node.member
         if hasattr(node, 'member'):
             return node.member
-        elif hasattr(node, 'name'):
+        if hasattr(node, 'name'):
             return node.name
-        elif isinstance(node, str):
-            return node
         return None
     
     def _resolve_function_calls(self) -> None:
         """Resolve function calls to actual function references"""
+        # Index functions by bare method name once so each call resolves
+        # with a dict lookup instead of a scan over every function key
+        self._by_method_name: Dict[str, List[str]] = defaultdict(list)
+        for func_key, func_info in self.functions.items():
+            self._by_method_name[func_info.name].append(func_key)
+
+        # Resolution depends only on the caller's class and the call text,
+        # and a few utilities dominate real call sites, so memoize per
+        # (class, call) pair; a plain dict beats lru_cache's wrapper overhead
+        self._resolve_cache: Dict[Tuple[str, str], Optional[str]] = {}
+
         for func_key, func_info in self.functions.items():
             resolved_calls = []
             
             for call in func_info.called_functions:
                 resolved_call = self._resolve_single_call(call, func_info)
                 if resolved_call:
-                    resolved_calls.append(resolved_call)
+                    # Resolved keys mirror entries in self.functions; intern
+                    # so they share those key objects instead of copies
+                    resolved_calls.append(sys.intern(resolved_call))
                     
             func_info.called_functions = resolved_calls
     
     def _resolve_single_call(self, call: str, calling_func: FunctionInfo) -> Optional[str]:
         """Resolve a single function call to actual function reference"""
+        cache_key = (calling_func.class_name, call)
+        if cache_key in self._resolve_cache:
+            return self._resolve_cache[cache_key]
+
         # Direct function call within same class
         same_class_key = f"{calling_func.class_name}.{call}"
         if same_class_key in self.functions:
-            return same_class_key
-            
-        # Method call on field/variable (simplified resolution)
-        if '.' in call:
-            obj_name, method_name = call.split('.', 1)
-            
-            # Look for method in all classes
-            for class_name, class_info in self.classes.items():
-                potential_key = f"{class_name}.{method_name}"
-                if potential_key in self.functions:
-                    return potential_key
-        
-        # Direct method name lookup across all classes
-        for func_key in self.functions.keys():
-            if func_key.endswith(f".{call}"):
-                return func_key
-                
-        return None
+            resolved = same_class_key
+        else:
+            # Method call on field/variable (simplified resolution): strip
+            # the qualifier and look the bare method name up in the index
+            method_name = call.split('.', 1)[1] if '.' in call else call
+
+            candidates = self._by_method_name.get(method_name)
+            resolved = candidates[0] if candidates else None
+
+        self._resolve_cache[cache_key] = resolved
+        return resolved
     
     def get_functions_as_json(self) -> str:
         """Return all functions information as JSON string"""
         functions_data = {}
         for func_key, func_info in self.functions.items():
             functions_data[func_key] = func_info.to_dict()
-        
+
+        if orjson is not None:
+            return orjson.dumps(functions_data, option=orjson.OPT_INDENT_2).decode('utf-8')
         return json.dumps(functions_data, indent=2, ensure_ascii=False)
\ No newline at end of file
@@ -72,8 +72,8 @@ def main():
     print("="*40)
     
     # 检查Python版本
-    if sys.version_info < (3, 6):
-        print("错误: 需要Python 3.6或更高版本")
+    if sys.version_info < (3, 10):
+        print("错误: 需要Python 3.10或更高版本")
         sys.exit(1)
     
     # 创建虚拟环境